@@ -2,46 +2,214 @@
 빗썸 API 클라이언트 모듈
 KRW 마켓 종목 목록 조회, 캔들 데이터 조회 및 거래량 분석
 """
+import asyncio
+import inspect
 import logging
+import operator
 import random
-import time
-from typing import Any, Dict, List, Optional
-
-import requests
+import sys
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+import aiohttp
+import numpy as np
+import orjson
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba 미설치 환경에서는 순수 파이썬으로 실행
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 # 로거 초기화 (모듈 레벨)
 logger = logging.getLogger(__name__)
 
 
+@njit(cache=True, fastmath=True, parallel=True)
+def _batch_check_kernel(vol_tail, current_volumes, threshold):
+    """
+    여러 종목의 거래량 SMA 및 배수를 한 번에 계산하는 커널 (Numba JIT, 종목별 병렬)
+
+    Args:
+        vol_tail: (종목 수, SMA 기간) 형태의 최근 거래량 행렬
+        current_volumes: 종목별 현재 거래량
+        threshold: 스파이크 배수 기준
+
+    Returns:
+        tuple: (SMA 배열, 배수 배열, 스파이크 여부 배열). SMA가 0 이하인 종목의 배수는 0.0
+    """
+    n, period = vol_tail.shape
+    sma = np.zeros(n)
+    multiplier = np.zeros(n)
+    is_spike = np.zeros(n, dtype=np.bool_)
+
+    for i in prange(n):
+        total = 0.0
+        for j in range(period):
+            total += vol_tail[i, j]
+        sma[i] = total / period
+
+        if sma[i] > 0.0:
+            multiplier[i] = current_volumes[i] / sma[i]
+            is_spike[i] = multiplier[i] >= threshold
+
+    return sma, multiplier, is_spike
+
+
+def _kernel_source_hash() -> int:
+    """AOT 빌드가 현재 커널 소스로 만들어졌는지 비교하기 위한 소스 해시"""
+    kernel = getattr(_batch_check_kernel, 'py_func', _batch_check_kernel)
+    return zlib.crc32(inspect.getsource(kernel).encode('utf-8'))
+
+
+try:
+    import volume_kernels
+except ImportError:
+    volume_kernels = None
+
+# build_aot.py로 미리 컴파일해 둔 커널이 현재 소스와 같으면 첫 호출 시 JIT 컴파일 없이 사용
+if volume_kernels is not None and volume_kernels.source_hash() == _kernel_source_hash():
+    _batch_check = volume_kernels.batch_check
+else:
+    if volume_kernels is not None:
+        logger.warning("volume_kernels AOT 빌드가 현재 커널 소스와 달라 JIT 커널을 사용합니다 (python build_aot.py로 다시 빌드하세요)")
+    _batch_check = _batch_check_kernel
+
+
+@dataclass
+class Candles:
+    """캔들 데이터 (필드별 NumPy 배열, 시간 오름차순 정렬)"""
+
+    time: np.ndarray  # int64, 밀리초 타임스탬프
+    open: np.ndarray  # float64
+    high: np.ndarray  # float64
+    low: np.ndarray  # float64
+    close: np.ndarray  # float64
+    volume: np.ndarray  # float64
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    @classmethod
+    def from_rows(cls, rows: np.ndarray) -> 'Candles':
+        """(time, open, close, high, low, volume) 순서의 2차원 배열로부터 생성"""
+        if rows.ndim != 2 or rows.shape[1] < 6 or len(rows) == 0:
+            return cls.empty()
+
+        rows = rows[np.argsort(rows[:, 0], kind='stable')]
+        columns = np.ascontiguousarray(rows[:, :6].T)
+        return cls(
+            time=columns[0].astype(np.int64),
+            open=columns[1],
+            high=columns[3],
+            low=columns[4],
+            close=columns[2],
+            volume=columns[5],
+        )
+
+    @classmethod
+    def empty(cls) -> 'Candles':
+        """빈 캔들 데이터"""
+        empty = np.empty(0, dtype=np.float64)
+        return cls(
+            time=np.empty(0, dtype=np.int64),
+            open=empty,
+            high=empty,
+            low=empty,
+            close=empty,
+            volume=empty,
+        )
+
+
 class BithumbAPI:
     """빗썸 공개 API 클라이언트"""
 
     BASE_URL = "https://api.bithumb.com/public"
-
-    def __init__(self, timeout: int = 10, max_retries: int = 2):
+    WS_URL = "wss://pubwss.bithumb.com/pub/ws"
+    RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+    # 딕셔너리 형태 캔들의 필드별 (기본 키, 대체 키). Candles.from_rows 열 순서와 같음
+    DICT_CANDLE_KEYS = (
+        ('time', 'dt'),
+        ('open', 'openPrice'),
+        ('close', 'closePrice'),
+        ('high', 'highPrice'),
+        ('low', 'lowPrice'),
+        ('volume', 'transactions'),
+    )
+
+    def __init__(
+        self,
+        timeout: int = 10,
+        max_retries: int = 2,
+        pool_size: int = 10,
+        keepalive_timeout: float = 30.0
+    ):
         """
         Args:
             timeout: API 요청 타임아웃 (초 단위, 기본값: 10초)
             max_retries: 실패 시 재시도 횟수 (기본값: 2)
+            pool_size: 연결 풀 크기 (동시에 열어 둘 keep-alive 연결 수, 기본값: 10)
+            keepalive_timeout: 유휴 연결 유지 시간 (초 단위, 기본값: 30초).
+                요청 간격보다 길어야 다음 요청에서 TCP/TLS 연결을 재사용함
         """
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'BithumbAlertBot/1.0'
-        })
+        self.session: Optional[aiohttp.ClientSession] = None  # 이벤트 루프 안에서 지연 생성
         self.timeout = timeout
         self.max_retries = max_retries
-
-    def _request_json(self, url: str, *, params: Optional[Dict[str, Any]] = None, context: str = "") -> Optional[Dict[str, Any]]:
+        self.pool_size = pool_size
+        self.keepalive_timeout = keepalive_timeout
+        self._base_candle = f"{self.BASE_URL}/candlestick/"  # 캔들 조회 URL 고정 부분
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """현재 이벤트 루프에 묶인 세션 반환 (없거나 닫혔으면 새로 생성)"""
+        if self.session is None or self.session.closed:
+            # 모든 요청이 api.bithumb.com 한 곳으로 가므로 호스트당 한도도 풀 크기와 맞춤
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.pool_size,
+                ttl_dns_cache=300,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'User-Agent': 'BithumbAlertBot/1.0'},
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self.session
+
+    async def close(self):
+        """HTTP 세션 종료"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+    async def _request_json(self, url: str, *, params: Optional[Dict[str, Any]] = None, context: str = "") -> Optional[Dict[str, Any]]:
         attempts = self.max_retries + 1
+        session = self._get_session()
 
         for attempt in range(1, attempts + 1):
             try:
-                response = self.session.get(url, params=params, timeout=self.timeout)
-                response.raise_for_status()
-                return response.json()
-            except requests.exceptions.Timeout:
+                async with session.get(url, params=params) as response:
+                    status = response.status
+                    if status == 200:
+                        data = orjson.loads(await response.read())
+                        # 호출부에서 data['status']를 바로 참조할 수 있도록 형식은 여기서 한 번만 확인
+                        if isinstance(data, dict) and 'status' in data:
+                            return data
+                        logger.warning(f"{context} 응답 형식 오류 (status 필드 없음)")
+                        return None
+                    if status not in self.RETRYABLE_STATUS:
+                        logger.warning(f"{context} HTTP 오류 (status={status})")
+                        return None
+                    logger.warning(f"{context} HTTP 오류 (status={status}, attempt={attempt}/{attempts})")
+            except asyncio.TimeoutError:
                 logger.warning(f"{context} 타임아웃 (timeout={self.timeout}초, attempt={attempt}/{attempts})")
-            except requests.exceptions.RequestException as e:
+            except aiohttp.ClientError as e:
                 logger.warning(f"{context} 네트워크 오류 (attempt={attempt}/{attempts}): {e}")
             except Exception as e:
                 logger.error(f"{context} 예외 (attempt={attempt}/{attempts}): {e}", exc_info=True)
@@ -49,11 +217,11 @@ class BithumbAPI:
             if attempt < attempts:
                 base_delay = min(3.0, 0.3 * (2 ** (attempt - 1)))
                 jitter = random.uniform(0, 0.2)
-                time.sleep(base_delay + jitter)
+                await asyncio.sleep(base_delay + jitter)
 
         return None
 
-    def get_krw_markets(self) -> List[str]:
+    async def get_krw_markets(self) -> List[str]:
         """
         KRW 마켓 상장 종목 목록 조회
 
@@ -61,13 +229,13 @@ class BithumbAPI:
             List[str]: 종목 코드 리스트 (예: ['BTC', 'ETH', 'XRP', ...])
         """
         url = f"{self.BASE_URL}/ticker/ALL_KRW"
-        data = self._request_json(url, context="KRW 마켓 목록 조회")
+        data = await self._request_json(url, context="KRW 마켓 목록 조회")
 
         if not data:
             return []
 
-        if data.get('status') == '0000':
-            markets = [code for code in data.get('data', {}).keys() if code != 'date']
+        if data['status'] == '0000':
+            markets = [sys.intern(code) for code in data.get('data', {}).keys() if code != 'date']
             logger.debug(f"KRW 마켓 목록 조회 성공: {len(markets)}개 종목")
             return sorted(markets)
 
@@ -75,13 +243,47 @@ class BithumbAPI:
         logger.error(f"빗썸 API 오류 (KRW 마켓 목록): {error_msg}")
         return []
 
-    def get_candlestick(
+    async def get_all_tickers(self) -> Dict[str, Dict[str, float]]:
+        """
+        KRW 마켓 전 종목 시세 스냅샷 조회 (요청 1회)
+
+        Returns:
+            Dict[str, Dict[str, float]]: 종목 코드별 시세
+                (예: {'BTC': {'closing_price': ..., 'units_traded_24H': ..., 'acc_trade_value_24H': ...}})
+        """
+        url = f"{self.BASE_URL}/ticker/ALL_KRW"
+        data = await self._request_json(url, context="KRW 마켓 시세 스냅샷 조회")
+
+        if not data:
+            return {}
+
+        if data['status'] == '0000':
+            tickers = {}
+            for code, ticker in data.get('data', {}).items():
+                if code == 'date' or not isinstance(ticker, dict):
+                    continue
+                try:
+                    tickers[sys.intern(code)] = {
+                        'closing_price': float(ticker.get('closing_price', 0)),
+                        'units_traded_24H': float(ticker.get('units_traded_24H', 0)),
+                        'acc_trade_value_24H': float(ticker.get('acc_trade_value_24H', 0)),
+                    }
+                except (TypeError, ValueError):
+                    logger.debug("%s: 시세 스냅샷 파싱 실패 (스킵)", code)
+            logger.debug(f"KRW 마켓 시세 스냅샷 조회 성공: {len(tickers)}개 종목")
+            return tickers
+
+        error_msg = data.get('message', 'Unknown error')
+        logger.error(f"빗썸 API 오류 (KRW 마켓 시세 스냅샷): {error_msg}")
+        return {}
+
+    async def get_candlestick(
         self,
         order_currency: str,
         payment_currency: str = "KRW",
         chart_intervals: str = "5m",
         count: int = 100
-    ) -> Optional[List[Dict]]:
+    ) -> Optional[Candles]:
         """
         캔들 데이터 조회
 
@@ -92,12 +294,12 @@ class BithumbAPI:
             count: 조회할 캔들 개수 (기본값: 100)
 
         Returns:
-            List[Dict]: 캔들 데이터 리스트
+            Candles: 캔들 데이터 (필드별 NumPy 배열)
         """
-        url = f"{self.BASE_URL}/candlestick/{order_currency}_{payment_currency}/{chart_intervals}"
+        url = self._base_candle + order_currency + "_" + payment_currency + "/" + chart_intervals
         params = {'count': count}
 
-        data = self._request_json(
+        data = await self._request_json(
             url,
             params=params,
             context=f"{order_currency} 캔들 데이터 조회",
@@ -106,61 +308,110 @@ class BithumbAPI:
         if not data:
             return None
 
-        if data.get('status') == '0000':
+        if data['status'] == '0000':
             candles = data.get('data', [])
             parsed_candles = self._parse_candles(candles)
-            logger.debug(f"{order_currency} 캔들 데이터 조회 성공: {len(parsed_candles)}개")
+            logger.debug("%s 캔들 데이터 조회 성공: %d개", order_currency, len(parsed_candles))
             return parsed_candles
 
         error_msg = data.get('message', 'Unknown error')
         logger.warning(f"캔들 데이터 조회 실패 ({order_currency}): {error_msg}")
         return None
 
-    def _parse_candles(self, raw_data: List) -> List[Dict]:
-        """
-        빗썸 API 응답 데이터를 표준 형식으로 변환
-        """
-        parsed = []
-        for candle in raw_data:
-            if isinstance(candle, list) and len(candle) >= 6:
-                parsed.append({
-                    'time': candle[0],
-                    'open': float(candle[1]),
-                    'close': float(candle[2]),
-                    'high': float(candle[3]),
-                    'low': float(candle[4]),
-                    'volume': float(candle[5])
-                })
-            elif isinstance(candle, dict):
-                parsed.append({
-                    'time': candle.get('time', candle.get('dt', 0)),
-                    'open': float(candle.get('open', candle.get('openPrice', 0))),
-                    'close': float(candle.get('close', candle.get('closePrice', 0))),
-                    'high': float(candle.get('high', candle.get('highPrice', 0))),
-                    'low': float(candle.get('low', candle.get('lowPrice', 0))),
-                    'volume': float(candle.get('volume', candle.get('transactions', 0)))
-                })
-
-        parsed.sort(key=lambda x: x['time'])
-        return parsed
-
-    def get_current_ticker(self, order_currency: str, payment_currency: str = "KRW") -> Optional[Dict]:
+    def _parse_candles(self, raw_data: List) -> Candles:
+        """
+        빗썸 API 응답 데이터를 필드별 NumPy 배열로 변환
+        """
+        if not raw_data:
+            return Candles.empty()
+
+        if isinstance(raw_data[0], list):
+            try:
+                # 일반적인 응답 형태: [time, open, close, high, low, volume] 행 리스트
+                rows = np.array(raw_data, dtype=np.float64)
+            except (TypeError, ValueError):
+                rows = np.array(
+                    [candle[:6] for candle in raw_data if isinstance(candle, list) and len(candle) >= 6],
+                    dtype=np.float64,
+                )
+            return Candles.from_rows(rows)
+
+        candles = [candle for candle in raw_data if isinstance(candle, dict)]
+        if not candles:
+            return Candles.empty()
+
+        # 응답 내 스키마는 일정하므로 첫 캔들로 키를 한 번만 결정한 뒤 행마다 바로 꺼냄
+        first = candles[0]
+        get_fields = operator.itemgetter(*(
+            key if key in first else fallback for key, fallback in self.DICT_CANDLE_KEYS
+        ))
+        try:
+            rows = np.array([get_fields(candle) for candle in candles], dtype=np.float64)
+        except KeyError:
+            # 행마다 키가 섞여 있으면 필드별 대체 키/기본값으로 처리
+            rows = np.array(
+                [
+                    tuple(candle.get(key, candle.get(fallback, 0)) for key, fallback in self.DICT_CANDLE_KEYS)
+                    for candle in candles
+                ],
+                dtype=np.float64,
+            )
+        return Candles.from_rows(rows)
+
+    async def get_current_ticker(self, order_currency: str, payment_currency: str = "KRW") -> Optional[Dict]:
         """
         현재 시세 정보 조회 (실시간 거래량 포함)
         """
         url = f"{self.BASE_URL}/ticker/{order_currency}_{payment_currency}"
-        data = self._request_json(url, context=f"{order_currency} 시세 조회")
+        data = await self._request_json(url, context=f"{order_currency} 시세 조회")
 
         if not data:
             return None
 
-        if data.get('status') == '0000':
+        if data['status'] == '0000':
             return data.get('data', {})
 
         error_msg = data.get('message', 'Unknown error')
         logger.warning(f"시세 조회 실패 ({order_currency}): {error_msg}")
         return None
 
+    async def stream_transactions(
+        self,
+        symbols: List[str],
+        payment_currency: str = "KRW"
+    ) -> AsyncIterator[Dict]:
+        """
+        실시간 체결 스트림 구독 (WebSocket)
+
+        Args:
+            symbols: 구독할 종목 코드 리스트 (예: ['BTC', 'ETH'])
+            payment_currency: 결제 통화 (기본값: 'KRW')
+
+        Yields:
+            Dict: 체결 1건 (예: {'symbol': 'BTC_KRW', 'contPrice': ..., 'contQty': ..., 'contDtm': ...})
+        """
+        session = self._get_session()
+        async with session.ws_connect(self.WS_URL, heartbeat=30) as ws:
+            await ws.send_str(orjson.dumps({
+                'type': 'transaction',
+                'symbols': [f"{symbol}_{payment_currency}" for symbol in symbols],
+            }).decode())
+
+            async for msg in ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    if msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                        break
+                    continue
+
+                data = orjson.loads(msg.data)
+                if data.get('type') != 'transaction':
+                    # 연결/구독 응답 메시지 ({'status': '0000', 'resmsg': ...})
+                    logger.debug("체결 스트림 메시지: %s", data.get('resmsg', data))
+                    continue
+
+                for trade in data.get('content', {}).get('list', []):
+                    yield trade
+
 
 class VolumeAnalyzer:
     """거래량 분석기"""
@@ -173,74 +424,197 @@ class VolumeAnalyzer:
         """
         self.sma_period = sma_period
         self.volume_multiplier = volume_multiplier
+        # 종목별 롤링 상태: (최근 sma_period개 거래량, 거래량 합계, 마지막 캔들 시간)
+        self._sma_state: Dict[str, Tuple[Deque[float], float, int]] = {}
+
+    def is_warm(self, symbol: str) -> bool:
+        """종목의 롤링 상태가 SMA 계산에 충분한지 여부"""
+        state = self._sma_state.get(symbol)
+        return state is not None and len(state[0]) == self.sma_period
+
+    def seed(self, symbol: str, candles: Candles):
+        """전체 캔들 데이터로 종목의 롤링 상태 초기화"""
+        if not candles:
+            return
+
+        volumes = deque(candles.volume[-self.sma_period:].tolist(), maxlen=self.sma_period)
+        self._sma_state[symbol] = (volumes, sum(volumes), int(candles.time[-1]))
+
+    def update(self, symbol: str, candle_time: int, volume: float) -> Optional[Tuple[float, float]]:
+        """
+        캔들 1개로 롤링 상태를 O(1) 갱신
+
+        같은 시간의 캔들은 진행 중인 봉의 거래량 갱신으로 보고 마지막 값을 교체하고,
+        더 최신 캔들은 새 봉으로 추가함 (오래된 캔들은 무시)
 
-    def calculate_volume_sma(self, candles: List[Dict]) -> Optional[float]:
+        Returns:
+            Tuple[float, float]: (SMA, 배수). 상태가 없거나 부족하면 None
         """
-        거래량의 SMA 계산
+        state = self._sma_state.get(symbol)
+        if state is None:
+            return None
+
+        volumes, total, last_time = state
+        if candle_time == last_time:
+            total += volume - volumes[-1]
+            volumes[-1] = volume
+        elif candle_time > last_time:
+            if len(volumes) == volumes.maxlen:
+                total -= volumes[0]
+            volumes.append(volume)
+            total += volume
+            last_time = candle_time
+
+        self._sma_state[symbol] = (volumes, total, last_time)
+
+        if len(volumes) < self.sma_period:
+            return None
+
+        sma = total / self.sma_period
+        multiplier = volumes[-1] / sma if sma > 0 else 0.0
+        return sma, multiplier
+
+    def update_from_candles(self, symbol: str, candles: Candles) -> Optional[List[Tuple[int, float, float]]]:
         """
-        if not candles or len(candles) < self.sma_period:
+        최근 캔들 몇 개로 롤링 상태 갱신
+
+        마지막 캔들 시간 이전의 캔들은 건너뛰고, 그 이후 봉마다 갱신 직후의 SMA와 배수를 기록함
+
+        Returns:
+            List[Tuple[int, float, float]]: 갱신된 봉별 (candles 인덱스, SMA, 배수).
+                상태가 부족한 동안의 봉은 제외. 상태가 없거나 마지막 캔들 이후 구간이
+                비어 있으면 (전체 캔들로 다시 seed 해야 하므로) None
+        """
+        state = self._sma_state.get(symbol)
+        if state is None or not candles or int(candles.time[0]) > state[2]:
             return None
 
-        volumes = [candle['volume'] for candle in candles[-self.sma_period:]]
-        sma = sum(volumes) / len(volumes)
-        return sma
+        start = int(np.searchsorted(candles.time, state[2]))
+        updates = []
+        for i in range(start, len(candles)):
+            result = self.update(symbol, int(candles.time[i]), float(candles.volume[i]))
+            if result is not None:
+                updates.append((i, result[0], result[1]))
+        return updates
 
-    def check_volume_spike(
+    def add_volume(
         self,
-        candles: List[Dict],
-        current_volume: Optional[float] = None
-    ) -> Dict[str, Any]:
-        """
-        현재 거래량이 평균 대비 배수 이상인지 확인
-        """
-        result = {
-            'is_spike': False,
-            'current_volume': 0.0,
-            'sma_volume': 0.0,
-            'multiplier': 0.0,
-            'candles_needed': self.sma_period
-        }
+        symbol: str,
+        candle_time: int,
+        volume: float,
+        interval_ms: int
+    ) -> Optional[Tuple[float, float]]:
+        """
+        체결 1건의 거래량을 해당 봉에 누적 (실시간 체결 스트림용)
 
-        if not candles:
-            return result
+        체결이 없어 건너뛴 봉은 거래량 0으로 채운 뒤 새 봉을 추가함
 
-        if current_volume is None:
-            result['current_volume'] = candles[-1]['volume']
-        else:
-            result['current_volume'] = current_volume
+        Returns:
+            Tuple[float, float]: (SMA, 배수). 상태가 없거나 지난 봉의 체결이면 None
+        """
+        state = self._sma_state.get(symbol)
+        if state is None:
+            return None
 
-        sma_volume = self.calculate_volume_sma(candles)
-        if sma_volume is None or sma_volume == 0:
-            result['candles_needed'] = self.sma_period - len(candles)
-            return result
+        volumes, _, last_time = state
+        if candle_time < last_time:
+            return None
 
-        result['sma_volume'] = sma_volume
-        result['multiplier'] = result['current_volume'] / sma_volume
-        result['is_spike'] = result['multiplier'] >= self.volume_multiplier
+        if candle_time == last_time:
+            return self.update(symbol, candle_time, volumes[-1] + volume)
 
-        return result
+        missing = min((candle_time - last_time) // interval_ms - 1, self.sma_period)
+        for i in range(1, missing + 1):
+            self.update(symbol, last_time + i * interval_ms, 0.0)
+        return self.update(symbol, candle_time, volume)
 
-    def analyze_market(
-        self,
-        candles: List[Dict],
-        symbol: str
-    ) -> Optional[Dict]:
+    def analyze_state(self, symbol: str, current_price: float) -> Optional[Dict]:
         """
-        종목의 거래량 스파이크 분석
+        롤링 상태 기준 거래량 스파이크 분석
         """
-        if not candles:
+        if not self.is_warm(symbol):
             return None
 
-        analysis = self.check_volume_spike(candles)
+        volumes, total, last_time = self._sma_state[symbol]
+        sma_volume = total / self.sma_period
+        if sma_volume <= 0:
+            return None
+
+        current_volume = volumes[-1]
+        multiplier = current_volume / sma_volume
+        if multiplier < self.volume_multiplier:
+            return None
 
-        if analysis['is_spike']:
-            return {
+        return {
+            'symbol': symbol,
+            'current_volume': current_volume,
+            'sma_volume': sma_volume,
+            'multiplier': multiplier,
+            'current_price': current_price,
+            'timestamp': last_time
+        }
+
+    def analyze_batch(self, symbols: List[str], current_prices: List[float]) -> Dict[str, Dict]:
+        """
+        여러 종목의 롤링 상태를 한 번의 커널 호출로 분석
+
+        Args:
+            symbols: 종목 코드 리스트
+            current_prices: 종목별 현재가 (symbols와 같은 순서)
+
+        Returns:
+            Dict[str, Dict]: 종목별 분석 결과 (analyze_state 형식 + 'is_spike').
+                롤링 상태가 부족한 종목은 제외
+        """
+        warm = [(symbol, price) for symbol, price in zip(symbols, current_prices) if self.is_warm(symbol)]
+        if not warm:
+            return {}
+
+        vol_tail = np.array([self._sma_state[symbol][0] for symbol, _ in warm], dtype=np.float64)
+        current_volumes = np.ascontiguousarray(vol_tail[:, -1])
+        sma, multiplier, is_spike = _batch_check(
+            vol_tail,
+            current_volumes,
+            float(self.volume_multiplier),
+        )
+
+        results = {}
+        for i, (symbol, price) in enumerate(warm):
+            results[symbol] = {
                 'symbol': symbol,
-                'current_volume': analysis['current_volume'],
-                'sma_volume': analysis['sma_volume'],
-                'multiplier': analysis['multiplier'],
-                'current_price': candles[-1]['close'],
-                'timestamp': candles[-1]['time']
+                'current_volume': float(current_volumes[i]),
+                'sma_volume': float(sma[i]),
+                'multiplier': float(multiplier[i]),
+                'current_price': price,
+                'timestamp': self._sma_state[symbol][2],
+                'is_spike': bool(is_spike[i]),
             }
+        return results
+
+    def export_state(self) -> Dict[str, Any]:
+        """롤링 상태를 JSON 직렬화 가능한 형태로 변환"""
+        return {
+            'sma_period': self.sma_period,
+            'symbols': {
+                symbol: {'volumes': list(volumes), 'last_time': last_time}
+                for symbol, (volumes, _, last_time) in self._sma_state.items()
+            },
+        }
 
-        return None
+    def load_state(self, data: Dict[str, Any]) -> int:
+        """
+        export_state로 저장한 롤링 상태 복원 (SMA 기간이 다르면 무시)
+
+        Returns:
+            int: 복원된 종목 수
+        """
+        if not isinstance(data, dict) or data.get('sma_period') != self.sma_period:
+            return 0
+
+        for symbol, entry in data.get('symbols', {}).items():
+            try:
+                volumes = deque((float(v) for v in entry['volumes']), maxlen=self.sma_period)
+                self._sma_state[symbol] = (volumes, sum(volumes), int(entry['last_time']))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return len(self._sma_state)
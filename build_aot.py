@@ -0,0 +1,32 @@
+"""
+거래량 분석 커널 AOT 컴파일 스크립트
+bithumb_api의 Numba 커널을 공유 라이브러리(volume_kernels)로 미리 컴파일해
+봇 시작 후 첫 모니터링 사이클의 JIT 컴파일 지연을 없앰
+
+사용법:
+    python build_aot.py
+"""
+import os
+
+from numba.pycc import CC
+
+from bithumb_api import _batch_check_kernel, _kernel_source_hash
+
+# 빌드 시점의 커널 소스 해시. 런타임에 현재 소스와 다르면 이 빌드는 사용되지 않음
+SOURCE_HASH = _kernel_source_hash()
+
+cc = CC('volume_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# JIT 커널과 같은 파이썬 구현을 그대로 export (AOT 컴파일은 병렬화를 지원하지 않아 prange는 순차 실행)
+cc.export('batch_check', 'Tuple((f8[:], f8[:], b1[:]))(f8[:, :], f8[:], f8)')(_batch_check_kernel.py_func)
+
+
+@cc.export('source_hash', 'i8()')
+def source_hash():
+    return SOURCE_HASH
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"컴파일 완료: {cc.output_dir}/{cc.name}")
@@ -2,15 +2,17 @@
 빗썸얼러트봇 메인 스크립트
 5분봉 거래량이 20 SMA 대비 5배 이상일 때 디스코드 알림
 """
-import json
+import asyncio
 import logging
+import math
 import os
 import random
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional, Set
+from typing import Dict, Optional, Set, Tuple
 
+import orjson
 from dotenv import load_dotenv
 
 from bithumb_api import BithumbAPI, VolumeAnalyzer
@@ -38,6 +40,39 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 logger.info(f"로그 파일 저장 위치: {log_file.absolute()}")
 
+# 캔들 간격별 길이 (초 단위)
+CANDLE_INTERVAL_SECONDS = {
+    '1m': 60,
+    '3m': 180,
+    '5m': 300,
+    '15m': 900,
+    '30m': 1800,
+    '1h': 3600,
+    '4h': 14400,
+    '1d': 86400,
+}
+
+# 롤링 상태가 없을 때 조회할 캔들 개수
+FULL_CANDLE_COUNT = 50
+
+# 알림 캐시 파일 최소 저장 간격 (초 단위)
+ALERT_CACHE_FLUSH_SECONDS = 30
+
+# 적응형 스캔: 배수가 VOLUME_MULTIPLIER * COLD_MULTIPLIER_RATIO 미만인 사이클이
+# COLD_STREAK회 이어지면 COLD_SKIP_CYCLES 사이클 동안 체크 생략 (4사이클에 1번만 체크)
+COLD_MULTIPLIER_RATIO = 0.2
+COLD_STREAK = 5
+COLD_SKIP_CYCLES = 3
+
+# 실시간 체결 스트림 모드에서 지원하는 캔들 간격 (체결 시각으로 봉 경계를 계산할 수 있는 간격)
+WEBSOCKET_INTERVALS = ('1m', '3m', '5m', '15m', '30m', '1h')
+
+# 실시간 체결 스트림 재구독 주기 (초 단위). 재구독 시 종목 목록과 롤링 상태를 REST로 다시 맞춤
+WS_RESUBSCRIBE_SECONDS = 3600
+
+# 빗썸 체결 시각(contDtm) 기준 시간대
+KST = timezone(timedelta(hours=9))
+
 
 class BithumbAlertBot:
     """빗썸얼러트봇 클래스"""
@@ -57,6 +92,10 @@ class BithumbAlertBot:
         alert_cache_file: str = "alerted_symbols_cache.json",
         min_krw_volume: float = 0.0,
         api_max_retries: int = 2,
+        api_concurrency: int = 10,
+        sma_state_file: str = "sma_state_cache.json",
+        use_websocket: bool = False,
+        adaptive_scan: bool = False,
     ):
         """
         Args:
@@ -73,8 +112,18 @@ class BithumbAlertBot:
             alert_cache_file: 알림 이력 캐시 파일 경로
             min_krw_volume: 최소 거래대금(원) 기준. 미만이면 알림 제외
             api_max_retries: API 재시도 횟수
+            api_concurrency: 동시에 진행할 캔들 조회 요청 수 (기본값: 10)
+            sma_state_file: 종목별 거래량 롤링 상태 캐시 파일 경로
+            use_websocket: 연속 모드에서 폴링 대신 실시간 체결 스트림 사용 여부
+            adaptive_scan: 거래량이 계속 낮은 종목은 몇 사이클에 한 번만 체크할지 여부
         """
-        self.bithumb_api = BithumbAPI(timeout=api_timeout, max_retries=api_max_retries)
+        self.bithumb_api = BithumbAPI(
+            timeout=api_timeout,
+            max_retries=api_max_retries,
+            pool_size=api_concurrency,
+            # 사이클 사이 대기 동안 풀의 연결이 닫히지 않도록 체크 간격보다 길게 유지
+            keepalive_timeout=check_interval + 30,
+        )
         self.volume_analyzer = VolumeAnalyzer(
             sma_period=sma_period,
             volume_multiplier=volume_multiplier
@@ -83,13 +132,27 @@ class BithumbAlertBot:
         self.check_interval = check_interval
         self.candle_interval = candle_interval
         self.api_delay = api_delay
+        self.api_concurrency = api_concurrency
         self.alert_reset_hours = alert_reset_hours
         self.send_startup_test = send_startup_test
         self.min_krw_volume = min_krw_volume
+        self.use_websocket = use_websocket
+        self.adaptive_scan = adaptive_scan
+        self._cold_counter: Dict[str, int] = {}  # 종목별 연속 저거래량 사이클 수
+        self._cold_skip: Dict[str, int] = {}  # 종목별 남은 체크 생략 사이클 수
         self.alerted_symbols: Set[str] = set()  # 이미 알림을 보낸 종목 추적
-        self.last_reset_time: Optional[datetime] = None  # 마지막 리셋 시간
+        self._alerts_in_flight: Set[str] = set()  # 알림 전송 중인 종목
+        self._alert_tasks: Set[asyncio.Task] = set()  # 진행 중인 알림 전송 태스크 (GC 방지용 참조)
+        self._last_reset_mono: Optional[float] = None  # 마지막 리셋 시각 (time.monotonic 기준)
         self.alert_cache_path = Path(alert_cache_file)
+        self._cache_dirty = False  # 파일에 아직 반영되지 않은 알림 이력 변경 여부
+        self._last_flush = time.monotonic()
+        self.sma_state_path = Path(sma_state_file)
+        # 롤링 상태가 있을 때는 종목별 마지막 조회 이후 지난 시간만큼의 캔들만 조회
+        self.candle_interval_seconds = CANDLE_INTERVAL_SECONDS.get(candle_interval, 300)
+        self._last_refresh: Dict[str, float] = {}  # 종목별 마지막 캔들 조회 시각 (time.monotonic 기준)
         self._load_alert_cache()
+        self._load_sma_state()
 
     def _load_alert_cache(self):
         """파일 캐시에서 이전 알림 이력 복원"""
@@ -97,70 +160,216 @@ class BithumbAlertBot:
             if not self.alert_cache_path.exists():
                 return
 
-            data = json.loads(self.alert_cache_path.read_text(encoding='utf-8'))
+            data = orjson.loads(self.alert_cache_path.read_bytes())
             if isinstance(data, list):
                 self.alerted_symbols = {str(symbol) for symbol in data if symbol}
                 logger.info(f"알림 캐시 복원 완료: {len(self.alerted_symbols)}개 종목")
         except Exception as e:
             logger.warning(f"알림 캐시 복원 실패(무시): {e}")
 
+    @staticmethod
+    def _write_json_atomic(path: Path, payload):
+        """임시 파일에 쓴 뒤 교체하는 방식으로 JSON 저장"""
+        if path.parent != Path('.'):
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_path = path.with_suffix(path.suffix + '.tmp')
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, orjson.dumps(payload))
+        finally:
+            os.close(fd)
+        os.replace(temp_path, path)
+
     def _save_alert_cache(self):
         """현재 알림 이력을 파일에 저장"""
         try:
-            if self.alert_cache_path.parent != Path('.'):
-                self.alert_cache_path.parent.mkdir(parents=True, exist_ok=True)
-
-            payload = sorted(self.alerted_symbols)
-            temp_path = self.alert_cache_path.with_suffix(self.alert_cache_path.suffix + '.tmp')
-            temp_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding='utf-8')
-            temp_path.replace(self.alert_cache_path)
+            self._write_json_atomic(self.alert_cache_path, sorted(self.alerted_symbols))
+            self._cache_dirty = False
+            self._last_flush = time.monotonic()
         except Exception as e:
             logger.warning(f"알림 캐시 저장 실패(무시): {e}")
 
-    def get_all_krw_symbols(self) -> list:
-        """KRW 마켓 모든 종목 조회"""
-        logger.info("KRW 마켓 종목 목록 조회 중...")
-        symbols = self.bithumb_api.get_krw_markets()
-        logger.info(f"총 {len(symbols)}개 종목 발견")
-        return symbols
-
-    def check_symbol_volume(self, symbol: str) -> Optional[dict]:
+    def _flush_alert_cache(self, force: bool = False):
         """
-        특정 종목의 거래량 스파이크 확인
+        변경된 알림 이력을 모아서 저장 (알림마다 쓰지 않고 최소 간격을 둠)
 
         Args:
-            symbol: 종목 코드 (예: 'BTC')
-
-        Returns:
-            dict: 분석 결과 (스파이크가 없으면 None)
+            force: True면 저장 간격과 관계없이 즉시 저장 (종료 시 사용)
         """
+        if not self._cache_dirty:
+            return
+
+        if force or time.monotonic() - self._last_flush >= ALERT_CACHE_FLUSH_SECONDS:
+            self._save_alert_cache()
+
+    def _load_sma_state(self):
+        """파일 캐시에서 종목별 거래량 롤링 상태 복원"""
         try:
-            candles = self.bithumb_api.get_candlestick(
-                order_currency=symbol,
-                payment_currency="KRW",
-                chart_intervals=self.candle_interval,
-                count=50
-            )
+            if not self.sma_state_path.exists():
+                return
+
+            data = orjson.loads(self.sma_state_path.read_bytes())
+            # 다른 캔들 간격으로 쌓인 거래량이 섞이지 않도록 간격이 다르면 버림
+            saved_interval = data.get('candle_interval') if isinstance(data, dict) else None
+            if saved_interval != self.candle_interval:
+                logger.info(
+                    f"거래량 롤링 상태 무시: 캔들 간격 불일치 "
+                    f"(저장={saved_interval}, 현재={self.candle_interval})"
+                )
+                return
+
+            restored = self.volume_analyzer.load_state(data)
+            logger.info(f"거래량 롤링 상태 복원 완료: {restored}개 종목")
+        except Exception as e:
+            logger.warning(f"거래량 롤링 상태 복원 실패(무시): {e}")
+
+    def _save_sma_state(self):
+        """종목별 거래량 롤링 상태를 파일에 저장"""
+        try:
+            payload = self.volume_analyzer.export_state()
+            payload['candle_interval'] = self.candle_interval
+            self._write_json_atomic(self.sma_state_path, payload)
+        except Exception as e:
+            logger.warning(f"거래량 롤링 상태 저장 실패(무시): {e}")
+
+    async def get_krw_tickers(self) -> dict:
+        """KRW 마켓 모든 종목의 시세 스냅샷 조회 (종목 목록 + 24시간 거래량)"""
+        logger.info("KRW 마켓 시세 스냅샷 조회 중...")
+        tickers = await self.bithumb_api.get_all_tickers()
+        logger.info(f"총 {len(tickers)}개 종목 발견")
+        return tickers
 
-            if not candles or len(candles) < 20:
-                logger.debug(f"{symbol}: 캔들 데이터 부족 ({len(candles) if candles else 0}개)")
-                return None
+    def filter_liquid_symbols(self, tickers: dict) -> list:
+        """
+        24시간 거래대금 기준 저유동성 종목 사전 제외 (캔들 조회 전 단계)
 
-            analysis = self.volume_analyzer.analyze_market(candles, symbol)
-            if not analysis:
-                return None
+        현재 캔들의 거래대금은 24시간 거래대금을 넘을 수 없으므로,
+        24시간 거래대금이 기준 미만이면 캔들을 조회할 필요가 없음
+        """
+        symbols = sorted(tickers)
+        if self.min_krw_volume <= 0:
+            return symbols
+
+        liquid = []
+        for symbol in symbols:
+            ticker = tickers[symbol]
+            notional_24h = ticker['units_traded_24H'] * ticker['closing_price']
+            if notional_24h < self.min_krw_volume:
+                continue
+            liquid.append(symbol)
+
+        logger.info(
+            f"저유동성 사전 필터: {len(symbols) - len(liquid)}개 제외, {len(liquid)}개 종목 캔들 조회 대상"
+        )
+        return liquid
 
-            # 저유동성 필터: 현재 거래량 * 현재가 기준
-            notional_krw = float(analysis['current_volume']) * float(analysis['current_price'])
-            if self.min_krw_volume > 0 and notional_krw < self.min_krw_volume:
+    def _apply_liquidity_filter(self, analysis: Optional[dict]) -> Optional[dict]:
+        """저유동성 필터: 현재 거래량 * 현재가 기준 거래대금이 기준 미만이면 제외"""
+        if not analysis:
+            return None
+
+        notional_krw = float(analysis['current_volume']) * float(analysis['current_price'])
+        if self.min_krw_volume > 0 and notional_krw < self.min_krw_volume:
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
-                    f"{symbol}: 저유동성 필터로 제외 "
+                    f"{analysis['symbol']}: 저유동성 필터로 제외 "
                     f"(거래대금={notional_krw:,.0f} KRW < 최소 {self.min_krw_volume:,.0f} KRW)"
                 )
-                return None
+            return None
 
-            analysis['notional_krw'] = notional_krw
-            return analysis
+        analysis['notional_krw'] = notional_krw
+        return analysis
+
+    def _tail_candle_count(self, symbol: str, now: float) -> int:
+        """
+        롤링 상태의 마지막 캔들부터 현재 봉까지 덮는 최근 캔들 개수
+
+        마지막 조회 이후 지난 시간 동안 넘어간 봉 경계 수(올림)에 마지막 캔들과,
+        요청 지연 중 봉이 바뀌는 경우를 위한 여유 1개를 더함.
+        조회 기록이 없으면 (파일에서 복원한 상태 등) 전체 개수를 조회
+        """
+        last_refresh = self._last_refresh.get(symbol)
+        if last_refresh is None:
+            return FULL_CANDLE_COUNT
+
+        boundaries = math.ceil((now - last_refresh) / self.candle_interval_seconds)
+        return min(FULL_CANDLE_COUNT, boundaries + 2)
+
+    async def refresh_symbol_candles(
+        self,
+        symbol: str,
+        cycles_since_check: int = 1
+    ) -> Optional[Tuple[float, Optional[dict]]]:
+        """
+        특정 종목의 캔들을 조회해 거래량 롤링 상태 갱신
+
+        Args:
+            symbol: 종목 코드 (예: 'BTC')
+            cycles_since_check: 직전 체크 이후 지난 사이클 수 (1보다 크면 생략한 동안 지나간 봉도 분석)
+
+        Returns:
+            Tuple[float, Optional[dict]]: (최신 캔들 종가, 체크를 생략한 동안 지나간 봉 중
+                배수가 가장 큰 봉의 분석 결과). 생략한 사이클이 없으면 두 번째 값은 None.
+                캔들 데이터가 부족하거나 오류 시 None
+        """
+        try:
+            candles = None
+            updates = None
+            fetched_at = time.monotonic()
+
+            # 롤링 상태가 있으면 최근 캔들 몇 개만 조회해 O(1) 갱신
+            if self.volume_analyzer.is_warm(symbol):
+                tail = await self.bithumb_api.get_candlestick(
+                    order_currency=symbol,
+                    payment_currency="KRW",
+                    chart_intervals=self.candle_interval,
+                    count=self._tail_candle_count(symbol, fetched_at)
+                )
+                if tail:
+                    updates = self.volume_analyzer.update_from_candles(symbol, tail)
+                    if updates is not None:
+                        candles = tail
+
+            if candles is None:
+                candles = await self.bithumb_api.get_candlestick(
+                    order_currency=symbol,
+                    payment_currency="KRW",
+                    chart_intervals=self.candle_interval,
+                    count=FULL_CANDLE_COUNT
+                )
+
+                if not candles or len(candles) < self.volume_analyzer.sma_period:
+                    logger.debug("%s: 캔들 데이터 부족 (%d개)", symbol, len(candles) if candles else 0)
+                    return None
+
+                # 전체 캔들이 마지막 캔들 시간까지 닿으면 이어서 갱신해 지나간 봉의 배수도 계산
+                if self.volume_analyzer.is_warm(symbol):
+                    updates = self.volume_analyzer.update_from_candles(symbol, candles)
+                if updates is None:
+                    self.volume_analyzer.seed(symbol, candles)
+
+            self._last_refresh[symbol] = fetched_at
+            current_price = float(candles.close[-1])
+            if cycles_since_check <= 1 or not updates:
+                return current_price, None
+
+            # 진행 중인 최신 봉은 analyze_batch가 분석하므로 그 이전 봉 중 최대 배수만 반환
+            last_index = len(candles) - 1
+            peak = max((u for u in updates if u[0] != last_index), key=lambda u: u[2], default=None)
+            if peak is None:
+                return current_price, None
+
+            index, sma_volume, multiplier = peak
+            return current_price, {
+                'symbol': symbol,
+                'current_volume': float(candles.volume[index]),
+                'sma_volume': sma_volume,
+                'multiplier': multiplier,
+                'current_price': float(candles.close[index]),
+                'timestamp': int(candles.time[index]),
+                'is_spike': multiplier >= self.volume_analyzer.volume_multiplier,
+            }
 
         except Exception as e:
             logger.error(f"{symbol} 분석 중 오류: {e}")
@@ -173,39 +382,69 @@ class BithumbAlertBot:
         if self.alert_reset_hours is None:
             return
 
-        now = datetime.now()
+        # 단조 시계 사용: 호출 비용이 낮고 NTP 등 시스템 시간 조정에 영향받지 않음
+        now = time.monotonic()
 
-        if self.last_reset_time is None:
-            self.last_reset_time = now
+        if self._last_reset_mono is None:
+            self._last_reset_mono = now
             return
 
-        time_diff = now - self.last_reset_time
-        if time_diff >= timedelta(hours=self.alert_reset_hours):
+        if now - self._last_reset_mono >= self.alert_reset_hours * 3600.0:
             reset_count = len(self.alerted_symbols)
             self.alerted_symbols.clear()
-            self.last_reset_time = now
-            self._save_alert_cache()
+            self._last_reset_mono = now
+            self._cache_dirty = True
             logger.info(f"알림된 종목 목록 리셋 (리셋된 종목 수: {reset_count}개)")
 
-    def send_alert_if_needed(self, analysis: dict):
+    def send_alert_if_needed(self, analysis: dict) -> Optional[asyncio.Task]:
         """
-        필요시 디스코드 알림 전송
+        필요시 디스코드 알림 전송 태스크 시작
+
+        중복 체크는 이벤트 루프에서 바로 끝내고, 웹훅 요청은 별도 스레드에서 실행하는
+        태스크로 넘겨 호출한 쪽(체결 스트림 등)이 응답을 기다리지 않도록 함
 
         Args:
             analysis: 분석 결과 딕셔너리
+
+        Returns:
+            asyncio.Task: 전송 태스크 (이미 알림했거나 전송 중인 종목이면 None)
         """
         if not analysis:
-            return
+            return None
 
         symbol = analysis['symbol']
 
         self._reset_alerted_symbols_if_needed()
 
-        if symbol in self.alerted_symbols:
-            logger.debug(f"{symbol}: 이미 알림 전송됨 (스킵)")
-            return
+        if symbol in self.alerted_symbols or symbol in self._alerts_in_flight:
+            logger.debug("%s: 이미 알림 전송됨 (스킵)", symbol)
+            return None
 
-        success = self.discord_webhook.send_alert(analysis, candle_interval=self.candle_interval)
+        logger.warning(
+            f"⚠️ {symbol} 거래량 급증 감지! "
+            f"현재: {analysis['current_volume']:,.2f}, "
+            f"평균: {analysis['sma_volume']:,.2f}, "
+            f"배수: {analysis['multiplier']:.2f}배"
+        )
+
+        # 전송이 끝나기 전에 같은 종목 스파이크가 다시 들어와도 중복 전송하지 않도록 먼저 표시
+        self._alerts_in_flight.add(symbol)
+        task = asyncio.create_task(self._send_alert(analysis))
+        self._alert_tasks.add(task)
+        task.add_done_callback(self._alert_tasks.discard)
+        return task
+
+    async def _send_alert(self, analysis: dict):
+        """웹훅 요청을 별도 스레드에서 실행하고 결과를 알림 이력에 반영"""
+        symbol = analysis['symbol']
+        try:
+            success = await asyncio.to_thread(
+                self.discord_webhook.send_alert,
+                analysis,
+                candle_interval=self.candle_interval,
+            )
+        finally:
+            self._alerts_in_flight.discard(symbol)
 
         if success:
             logger.info(
@@ -213,86 +452,277 @@ class BithumbAlertBot:
                 f"(배수: {analysis['multiplier']:.2f}배, 거래대금: {analysis.get('notional_krw', 0):,.0f} KRW)"
             )
             self.alerted_symbols.add(symbol)
-            self._save_alert_cache()
+            self._cache_dirty = True
         else:
             logger.error(f"{symbol} 알림 전송 실패")
 
-    def monitor_once(self):
-        """한 번의 모니터링 사이클 실행"""
+    def _is_cold(self, symbol: str) -> bool:
+        """직전 체크까지 저거래량이 COLD_STREAK회 이상 이어진 종목인지 여부"""
+        return self._cold_counter.get(symbol, 0) >= COLD_STREAK
+
+    def _select_symbols_to_check(self, symbols: list) -> list:
+        """적응형 스캔: 체크 생략 중인 저거래량 종목을 이번 사이클 대상에서 제외"""
+        selected = []
+        for symbol in symbols:
+            skip = self._cold_skip.get(symbol, 0)
+            if skip > 0:
+                self._cold_skip[symbol] = skip - 1
+                continue
+            selected.append(symbol)
+        return selected
+
+    def _update_cold_state(self, symbol: str, multiplier: Optional[float]):
+        """체크 결과 배수로 종목의 저거래량 연속 횟수와 체크 생략 사이클 갱신"""
+        cold_threshold = self.volume_analyzer.volume_multiplier * COLD_MULTIPLIER_RATIO
+
+        if multiplier is None or multiplier >= cold_threshold:
+            self._cold_counter.pop(symbol, None)
+            self._cold_skip.pop(symbol, None)
+            return
+
+        self._cold_counter[symbol] = self._cold_counter.get(symbol, 0) + 1
+        if self._is_cold(symbol):
+            self._cold_skip[symbol] = COLD_SKIP_CYCLES
+
+    async def _bounded_refresh(
+        self,
+        sem: asyncio.Semaphore,
+        symbol: str,
+        cycles_since_check: int = 1
+    ) -> Optional[Tuple[float, Optional[dict]]]:
+        """세마포어로 동시 요청 수를 제한하면서 종목 캔들 갱신"""
+        async with sem:
+            result = await self.refresh_symbol_candles(symbol, cycles_since_check)
+            # 슬롯별로 딜레이를 두어 빗썸 API 요청 속도 제한 준수
+            if self.api_delay > 0:
+                await asyncio.sleep(self.api_delay)
+            return result
+
+    async def monitor_once_async(self, adaptive: bool = True) -> list:
+        """
+        한 번의 모니터링 사이클 실행 (종목별 캔들 조회를 동시에 진행)
+
+        Args:
+            adaptive: False면 적응형 스캔 설정과 관계없이 모든 종목 체크
+
+        Returns:
+            list: 유동성 필터를 통과한 종목 코드 리스트 (적응형 스캔으로 이번 사이클에 생략한 종목 포함)
+        """
         logger.info("=" * 60)
         logger.info(f"모니터링 시작 - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-        symbols = self.get_all_krw_symbols()
+        tickers = await self.get_krw_tickers()
 
-        if not symbols:
+        if not tickers:
             logger.warning("종목 목록을 가져올 수 없습니다.")
-            return
+            return []
+
+        symbols = self.filter_liquid_symbols(tickers)
+        use_adaptive = adaptive and self.adaptive_scan
+        targets = self._select_symbols_to_check(symbols) if use_adaptive else symbols
+        if len(targets) < len(symbols):
+            logger.info(f"적응형 스캔: 저거래량 종목 {len(symbols) - len(targets)}개 이번 사이클 생략")
+
+        sem = asyncio.Semaphore(self.api_concurrency)
+        tasks = [
+            self._bounded_refresh(sem, symbol, COLD_SKIP_CYCLES + 1 if self._is_cold(symbol) else 1)
+            for symbol in targets
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        refreshed = {}
+        missed_peaks = {}  # 체크를 생략한 동안 지나간 봉 중 배수가 가장 큰 봉
+        for symbol, result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.error(f"{symbol} 분석 중 오류: {result}")
+                continue
+            if result is None:
+                if use_adaptive:
+                    self._update_cold_state(symbol, None)
+                continue
+            refreshed[symbol], missed = result
+            if missed:
+                missed_peaks[symbol] = missed
+
+        # 갱신된 종목 전체를 한 번의 커널 호출로 분석
+        analyses = self.volume_analyzer.analyze_batch(list(refreshed), list(refreshed.values()))
 
         spike_count = 0
+        alert_tasks = []
+
+        for symbol in refreshed:
+            analysis = analyses.get(symbol)
+            missed = missed_peaks.get(symbol)
+            if missed and (not analysis or missed['multiplier'] > analysis['multiplier']):
+                analysis = missed
 
-        for i, symbol in enumerate(symbols, 1):
-            logger.debug(f"[{i}/{len(symbols)}] {symbol} 체크 중...")
+            if use_adaptive:
+                self._update_cold_state(symbol, analysis['multiplier'] if analysis else None)
 
-            analysis = self.check_symbol_volume(symbol)
+            if not analysis or not analysis.pop('is_spike'):
+                continue
 
+            analysis = self._apply_liquidity_filter(analysis)
             if analysis:
-                logger.warning(
-                    f"⚠️ {symbol} 거래량 급증 감지! "
-                    f"현재: {analysis['current_volume']:,.2f}, "
-                    f"평균: {analysis['sma_volume']:,.2f}, "
-                    f"배수: {analysis['multiplier']:.2f}배"
-                )
-                self.send_alert_if_needed(analysis)
+                task = self.send_alert_if_needed(analysis)
+                if task:
+                    alert_tasks.append(task)
                 spike_count += 1
 
-            time.sleep(self.api_delay)
+        # 종목별 알림을 동시에 전송하고 모두 끝난 뒤 알림 이력 저장
+        if alert_tasks:
+            await asyncio.gather(*alert_tasks)
+
+        self._save_sma_state()
+        self._flush_alert_cache()
 
         if spike_count > 0:
-            logger.info(f"모니터링 완료 - 총 {len(symbols)}개 종목 체크, {spike_count}개 거래량 급증 발견")
+            logger.info(f"모니터링 완료 - 총 {len(targets)}개 종목 체크, {spike_count}개 거래량 급증 발견")
         else:
-            logger.debug(f"모니터링 완료 - {len(symbols)}개 종목 이상 없음")
+            logger.debug("모니터링 완료 - %d개 종목 이상 없음", len(targets))
+
+        return symbols
+
+    async def _monitor_once_and_close(self):
+        """단일 사이클 실행 후 HTTP 세션 정리"""
+        try:
+            await self.monitor_once_async()
+        finally:
+            await self.bithumb_api.close()
+            self._flush_alert_cache(force=True)
+
+    def monitor_once(self):
+        """한 번의 모니터링 사이클 실행 (단일 실행 모드용)"""
+        asyncio.run(self._monitor_once_and_close())
+
+    @staticmethod
+    def _failure_backoff_seconds(consecutive_failures: int) -> int:
+        """연속 실패 횟수에 따른 재시도 대기 시간 (지수 백오프 + jitter)"""
+        base_backoff = min(300, 30 * (2 ** (consecutive_failures - 1)))
+        jitter = random.uniform(0, min(10, base_backoff * 0.2))
+        return int(base_backoff + jitter)
+
+    def _on_trade(self, trade: dict, interval_ms: int):
+        """체결 1건을 롤링 상태에 반영하고 스파이크면 알림"""
+        try:
+            symbol = trade['symbol'].split('_')[0]
+            price = float(trade['contPrice'])
+            quantity = float(trade['contQty'])
+            traded_at = datetime.strptime(trade['contDtm'], '%Y-%m-%d %H:%M:%S.%f').replace(tzinfo=KST)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug("체결 데이터 파싱 실패 (스킵): %s", e)
+            return
+
+        timestamp_ms = int(traded_at.timestamp() * 1000)
+        candle_time = timestamp_ms - timestamp_ms % interval_ms
+        if self.volume_analyzer.add_volume(symbol, candle_time, quantity, interval_ms) is None:
+            return
+
+        analysis = self._apply_liquidity_filter(self.volume_analyzer.analyze_state(symbol, price))
+        if analysis:
+            self.send_alert_if_needed(analysis)
+
+    async def _ws_consume(self, symbols: list):
+        """실시간 체결 스트림을 구독해 봉별 거래량을 누적 (재구독 주기가 지나면 반환)"""
+        interval_ms = CANDLE_INTERVAL_SECONDS[self.candle_interval] * 1000
+        started = last_flush = time.monotonic()
+
+        stream = self.bithumb_api.stream_transactions(symbols)
+        try:
+            async for trade in stream:
+                self._on_trade(trade, interval_ms)
+
+                now = time.monotonic()
+                if now - last_flush >= self.check_interval:
+                    self._save_sma_state()
+                    self._flush_alert_cache()
+                    last_flush = now
+                if now - started >= WS_RESUBSCRIBE_SECONDS:
+                    break
+            else:
+                raise ConnectionError("실시간 체결 스트림 연결이 끊어졌습니다.")
+        finally:
+            await stream.aclose()
+
+    async def _run_polling(self):
+        """check_interval마다 전 종목 캔들을 조회하는 폴링 루프"""
+        consecutive_failures = 0
+
+        while True:
+            try:
+                await self.monitor_once_async()
+                consecutive_failures = 0
+
+                logger.info(f"{self.check_interval}초 후 다음 체크 예정...")
+                await asyncio.sleep(self.check_interval)
+
+            except Exception as e:
+                consecutive_failures += 1
+                logger.error(f"모니터링 중 오류 발생: {e}", exc_info=True)
+
+                wait_seconds = self._failure_backoff_seconds(consecutive_failures)
+                logger.info(
+                    f"연속 실패 {consecutive_failures}회 - "
+                    f"{wait_seconds}초 후 재시도합니다."
+                )
+                await asyncio.sleep(wait_seconds)
+
+    async def _run_websocket(self):
+        """REST로 롤링 상태를 채운 뒤 실시간 체결 스트림으로 감시하는 루프"""
+        consecutive_failures = 0
+
+        while True:
+            try:
+                # 구독 전 백필이므로 적응형 스캔 없이 모든 종목의 롤링 상태를 맞춤
+                symbols = await self.monitor_once_async(adaptive=False)
+                if not symbols:
+                    raise RuntimeError("구독할 종목이 없습니다.")
+
+                logger.info(f"실시간 체결 스트림 구독 시작: {len(symbols)}개 종목")
+                await self._ws_consume(symbols)
+                consecutive_failures = 0
+                logger.info("실시간 체결 스트림 재구독")
+
+            except Exception as e:
+                consecutive_failures += 1
+                logger.error(f"실시간 체결 스트림 오류 발생: {e}", exc_info=True)
+
+                wait_seconds = self._failure_backoff_seconds(consecutive_failures)
+                logger.info(
+                    f"연속 실패 {consecutive_failures}회 - "
+                    f"{wait_seconds}초 후 재연결합니다."
+                )
+                await asyncio.sleep(wait_seconds)
+
+    async def run_continuous_async(self):
+        """하나의 이벤트 루프에서 모니터링 반복 (HTTP 세션을 사이클 간 재사용)"""
+        try:
+            if self.use_websocket:
+                await self._run_websocket()
+            else:
+                await self._run_polling()
+        finally:
+            await self.bithumb_api.close()
 
     def run_continuous(self):
         """지속적으로 모니터링 실행"""
         logger.info("빗썸얼러트봇 시작")
         logger.info(f"체크 간격: {self.check_interval}초 ({self.check_interval / 60:.1f}분)")
         logger.info(f"캔들 기간: {self.candle_interval}")
+        if self.use_websocket:
+            logger.info("실시간 체결 스트림 모드")
 
         if self.send_startup_test:
             self.discord_webhook.send_test_message()
 
-        consecutive_failures = 0
-
         try:
-            while True:
-                try:
-                    self.monitor_once()
-                    consecutive_failures = 0
-
-                    logger.info(f"{self.check_interval}초 후 다음 체크 예정...")
-                    time.sleep(self.check_interval)
-
-                except KeyboardInterrupt:
-                    logger.info("사용자에 의해 중지되었습니다.")
-                    break
-                except Exception as e:
-                    consecutive_failures += 1
-                    logger.error(f"모니터링 중 오류 발생: {e}", exc_info=True)
-
-                    base_backoff = min(300, 30 * (2 ** (consecutive_failures - 1)))
-                    jitter = random.uniform(0, min(10, base_backoff * 0.2))
-                    wait_seconds = int(base_backoff + jitter)
-
-                    logger.info(
-                        f"연속 실패 {consecutive_failures}회 - "
-                        f"{wait_seconds}초 후 재시도합니다."
-                    )
-                    time.sleep(wait_seconds)
-
+            asyncio.run(self.run_continuous_async())
+        except KeyboardInterrupt:
+            logger.info("사용자에 의해 중지되었습니다.")
         except Exception as e:
             logger.error(f"치명적 오류: {e}", exc_info=True)
         finally:
-            self._save_alert_cache()
+            self._flush_alert_cache(force=True)
             logger.info("모니터링 종료")
 
 
@@ -307,6 +737,8 @@ def validate_config(
     alert_reset_hours: Optional[int],
     min_krw_volume: float,
     api_max_retries: int,
+    api_concurrency: int,
+    use_websocket: bool,
 ) -> bool:
     """
     설정 값 검증
@@ -325,7 +757,7 @@ def validate_config(
     if sma_period < 1:
         errors.append("SMA_PERIOD는 최소 1 이상이어야 합니다.")
 
-    valid_intervals = ['1m', '3m', '5m', '15m', '30m', '1h', '4h', '1d']
+    valid_intervals = list(CANDLE_INTERVAL_SECONDS)
     if candle_interval not in valid_intervals:
         errors.append(f"CANDLE_INTERVAL은 다음 중 하나여야 합니다: {', '.join(valid_intervals)}")
 
@@ -347,6 +779,12 @@ def validate_config(
     if api_max_retries < 0:
         errors.append("API_MAX_RETRIES는 0 이상이어야 합니다.")
 
+    if api_concurrency < 1:
+        errors.append("API_CONCURRENCY는 최소 1 이상이어야 합니다.")
+
+    if use_websocket and candle_interval not in WEBSOCKET_INTERVALS:
+        errors.append(f"USE_WEBSOCKET 사용 시 CANDLE_INTERVAL은 다음 중 하나여야 합니다: {', '.join(WEBSOCKET_INTERVALS)}")
+
     if errors:
         for error in errors:
             logger.error(f"설정 오류: {error}")
@@ -377,6 +815,10 @@ def main():
     alert_cache_file = os.getenv('ALERT_CACHE_FILE', 'alerted_symbols_cache.json')
     min_krw_volume = float(os.getenv('MIN_KRW_VOLUME', '0'))
     api_max_retries = int(os.getenv('API_MAX_RETRIES', '2'))
+    api_concurrency = int(os.getenv('API_CONCURRENCY', '10'))
+    sma_state_file = os.getenv('SMA_STATE_FILE', 'sma_state_cache.json')
+    use_websocket = os.getenv('USE_WEBSOCKET', 'false').lower() == 'true'
+    adaptive_scan = os.getenv('ADAPTIVE_SCAN', 'false').lower() == 'true'
 
     if not validate_config(
         check_interval,
@@ -389,6 +831,8 @@ def main():
         alert_reset_hours,
         min_krw_volume,
         api_max_retries,
+        api_concurrency,
+        use_websocket,
     ):
         logger.error("설정 검증 실패. 프로그램을 종료합니다.")
         return
@@ -407,6 +851,10 @@ def main():
         alert_cache_file=alert_cache_file,
         min_krw_volume=min_krw_volume,
         api_max_retries=api_max_retries,
+        api_concurrency=api_concurrency,
+        sma_state_file=sma_state_file,
+        use_websocket=use_websocket,
+        adaptive_scan=adaptive_scan,
     )
 
     run_once = os.getenv('RUN_ONCE', 'false').lower() == 'true'